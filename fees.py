@@ -0,0 +1,106 @@
+import csv
+from io import BytesIO, TextIOWrapper
+
+import numpy as np
+import pandas as pd
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import LETTER
+from reportlab.lib.units import mm
+from reportlab.pdfgen import canvas
+from reportlab.platypus import Table, TableStyle
+
+PDF_TABLE_STYLE = TableStyle([
+    ("FONT", (0, 0), (-1, -1), "Helvetica", 9),
+    ("FONT", (0, 0), (-1, 0), "Helvetica-Bold", 9),
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+])
+
+
+def compute_fees(phase_names, hours, rate_values, construction_cost, base_fee_percent, complexity_factor,
+                 location_factor, risk_factor, firm_multiplier, consultant_names, consultant_pcts):
+    hours_arr = np.asarray(hours, dtype=np.float64)
+    rates_vec = np.array(rate_values, dtype=np.float64)
+    phase_totals = hours_arr @ rates_vec
+    total_raw_labor_cost = float(phase_totals.sum())
+    workplan_fee = total_raw_labor_cost * firm_multiplier
+    adjusted_fee_percent = base_fee_percent * complexity_factor * location_factor * risk_factor
+    construction_fee = construction_cost * adjusted_fee_percent
+    fees_arr = construction_cost * np.asarray(consultant_pcts, dtype=np.float64) / 100.0
+    df_consultants = pd.DataFrame({"Consultant": consultant_names, "Fee ($)": fees_arr})
+
+    summary_rows = (
+        ("Workplan Method Fee", workplan_fee),
+        ("Construction % Method Fee", construction_fee),
+        ("Total Labor Cost", total_raw_labor_cost),
+        *((f"{k} (Consultant)", v) for k, v in zip(consultant_names, fees_arr.tolist())),
+    )
+    df_phase_labor = pd.DataFrame({"Phase": phase_names, "Labor Cost ($)": phase_totals})
+    return total_raw_labor_cost, workplan_fee, construction_fee, df_consultants, summary_rows, df_phase_labor
+
+
+def rows_to_csv(header, rows):
+    buf = BytesIO()
+    text = TextIOWrapper(buf, encoding="utf-8", newline="", write_through=True)
+    writer = csv.writer(text, lineterminator="\n")
+    writer.writerow(header)
+    writer.writerows(rows)
+    text.detach()
+    return buf.getvalue()
+
+
+def convert_df_to_csv(df):
+    return rows_to_csv(df.columns, df.to_numpy(dtype=object).tolist())
+
+
+def summary_to_csv(summary_rows):
+    metrics, amounts = zip(*summary_rows)
+    return rows_to_csv(metrics, [amounts])
+
+
+def create_pdf(summary_rows, hours_df, schedule_df):
+    summary_lines = [(f"{metric}:", f"${amount:,.2f}") for metric, amount in summary_rows]
+    hours_rows = [("Phase", *hours_df.columns), *hours_df.astype(str).itertuples(name=None)]
+    starts = pd.to_datetime(schedule_df["Start"]).dt.strftime("%Y-%m-%d").to_numpy()
+    ends = pd.to_datetime(schedule_df["End"]).dt.strftime("%Y-%m-%d").to_numpy()
+    schedule_rows = [("Phase", "Dates", "Duration")] + [
+        (f"{phase}", f"{start} to {end}", f"{duration} days")
+        for phase, start, end, duration in zip(
+            schedule_df["Phase"].to_numpy(), starts, ends, schedule_df["Duration (days)"].to_numpy()
+        )
+    ]
+
+    buf = BytesIO()
+    c = canvas.Canvas(buf, pagesize=LETTER)
+    page_width, page_height = LETTER
+    x = 10 * mm
+    y = page_height - 20 * mm
+
+    c.setFont("Helvetica-Bold", 12)
+    c.drawCentredString(page_width / 2, y, "Architect Fee Summary Report")
+    y -= 13 * mm
+
+    c.setFont("Helvetica", 10)
+    for label, value in summary_lines:
+        c.drawString(x, y, label)
+        c.drawString(x + 60 * mm, y, value)
+        y -= 8 * mm
+
+    for title, rows, col_widths in (
+        ("Hours per Phase", hours_rows, (60 * mm, 32 * mm, 32 * mm, 32 * mm, 32 * mm)),
+        ("Project Schedule", schedule_rows, (60 * mm, 60 * mm, 40 * mm)),
+    ):
+        table = Table(rows, colWidths=col_widths, style=PDF_TABLE_STYLE)
+        _, table_height = table.wrapOn(c, page_width - 2 * x, page_height)
+        y -= 10 * mm
+        if y - 6 * mm - table_height < 15 * mm:
+            c.showPage()
+            y = page_height - 20 * mm
+
+        c.setFont("Helvetica-Bold", 11)
+        c.drawString(x, y, title)
+        y -= 4 * mm + table_height
+        table.drawOn(c, x, y)
+
+    c.save()
+    return buf.getvalue()